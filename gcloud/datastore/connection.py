@@ -135,8 +135,9 @@ class Connection(connection.Connection):
         :returns: the mutation instance associated with the current transaction
                   (if one exists) or or a new mutation instance.
         """
-        if self.transaction():
-            return self.transaction().mutation()
+        transaction = self.transaction()
+        if transaction:
+            return transaction.mutation()
         else:
             return datastore_pb.Mutation()
 
@@ -317,10 +318,11 @@ class Connection(connection.Connection):
         :returns': the result protobuf for the mutation.
         """
         request = datastore_pb.CommitRequest()
+        transaction = self.transaction()
 
-        if self.transaction():
+        if transaction:
             request.mode = datastore_pb.CommitRequest.TRANSACTIONAL
-            request.transaction = self.transaction().id()
+            request.transaction = transaction.id()
         else:
             request.mode = datastore_pb.CommitRequest.NON_TRANSACTIONAL
 
@@ -340,11 +342,12 @@ class Connection(connection.Connection):
         :type dataset_id: string
         :param dataset_id: The dataset to which the transaction belongs.
         """
-        if not self.transaction() or not self.transaction().id():
+        transaction = self.transaction()
+        if not transaction or not transaction.id():
             raise ValueError('No transaction to rollback.')
 
         request = datastore_pb.RollbackRequest()
-        request.transaction = self.transaction().id()
+        request.transaction = transaction.id()
         # Nothing to do with this response, so just execute the method.
         self._rpc(dataset_id, 'rollback', request,
                   datastore_pb.RollbackResponse)
@@ -388,6 +391,7 @@ class Connection(connection.Connection):
         :type properties: dict
         :param properties: The properties to store on the entity.
         """
+        transaction = self.transaction()
         mutation = self.mutation()
 
         # If the Key is complete, we should upsert
@@ -402,17 +406,19 @@ class Connection(connection.Connection):
 
         insert.key.CopyFrom(key_pb)
 
+        add_property = insert.property.add
+        set_protobuf_value = helpers._set_protobuf_value
         for name, value in properties.iteritems():
-            prop = insert.property.add()
+            prop = add_property()
             # Set the name of the property.
             prop.name = name
 
             # Set the appropriate value.
-            helpers._set_protobuf_value(prop.value, value)
+            set_protobuf_value(prop.value, value)
 
         # If this is in a transaction, we should just return True. The
         # transaction will handle assigning any keys as necessary.
-        if self.transaction():
+        if transaction:
             return True
 
         result = self.commit(dataset_id, mutation)
@@ -441,13 +447,14 @@ class Connection(connection.Connection):
                 :class:`gcloud.datastore.datastore_v1_pb2.MutationResult`.
         :returns: True
         """
+        transaction = self.transaction()
         mutation = self.mutation()
 
         for key_pb in key_pbs:
             delete = mutation.delete.add()
             delete.CopyFrom(key_pb)
 
-        if not self.transaction():
+        if not transaction:
             self.commit(dataset_id, mutation)
 
         return True
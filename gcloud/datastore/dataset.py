@@ -124,13 +124,50 @@ class Dataset(object):
         :rtype: list of :class:`gcloud.datastore.entity.Entity`
         :return: The requested entities.
         """
+        # Skip duplicate keys, so the backend doesn't fetch them twice.
+        identities = []
+        key_pbs = []
+        seen = set()
+        for key in keys:
+            identity = _key_identity(key)
+            identities.append(identity)
+            if identity not in seen:
+                seen.add(identity)
+                key_pbs.append(key.to_protobuf())
+
         entity_pbs = self.connection().lookup(
             dataset_id=self.id(),
-            key_pbs=[k.to_protobuf() for k in keys]
+            key_pbs=key_pbs
         )
 
-        entities = []
+        entity_from_protobuf = helpers.entity_from_protobuf
+        if len(key_pbs) == len(identities):
+            return [entity_from_protobuf(entity_pb, dataset=self)
+                    for entity_pb in entity_pbs]
+
+        # Some keys were repeated:  fan the results back out, building a
+        # separate entity for each requested key.
+        key_from_protobuf = helpers.key_from_protobuf
+        found = {}
         for entity_pb in entity_pbs:
-            entities.append(helpers.entity_from_protobuf(
-                entity_pb, dataset=self))
-        return entities
+            found[_key_identity(key_from_protobuf(entity_pb.key))] = entity_pb
+        return [entity_from_protobuf(found[identity], dataset=self)
+                for identity in identities if identity in found]
+
+
+def _key_identity(key):
+    """Return a hashable value identifying the entity a key refers to.
+
+    An empty namespace is treated like an unset one, matching how
+    :meth:`gcloud.datastore.key.Key.to_protobuf` serializes it.
+
+    :type key: :class:`gcloud.datastore.key.Key`
+    :param key: The key to identify.
+
+    :rtype: tuple
+    :returns: The key's namespace and the kind, ID and name of each element
+              of its path.
+    """
+    return (key.namespace() or None,
+            tuple([(element.get('kind'), element.get('id'),
+                    element.get('name')) for element in key.path()]))
@@ -70,14 +70,39 @@ class Entity(dict):
 
     """
 
+    # Entities are created in bulk when loading query results;  avoid
+    # carrying a per-instance ``__dict__`` alongside the property dict.
+    __slots__ = ('_dataset', '_key')
+
     def __init__(self, dataset=None, kind=None):
         super(Entity, self).__init__()
         self._dataset = dataset
         if kind:
-            self._key = Key().kind(kind)
+            # Build the path directly:  ``Key().kind(kind)`` would deep-copy
+            # a throwaway default key.
+            self._key = Key(path=[{'kind': kind}])
         else:
             self._key = None
 
+    def __getstate__(self):
+        """Return the slot values, for pickling.
+
+        The properties are pickled as dictionary items;  the slots
+        must be saved explicitly, since there is no instance ``__dict__``.
+
+        :rtype: tuple
+        :returns: the entity's dataset and key.
+        """
+        return self._dataset, self._key
+
+    def __setstate__(self, state):
+        """Restore the slot values saved by :meth:`__getstate__`.
+
+        :type state: tuple
+        :param state: the entity's dataset and key.
+        """
+        self._dataset, self._key = state
+
     def dataset(self):
         """Get the :class:`.dataset.Dataset` in which this entity belongs.
 
@@ -210,10 +235,12 @@ class Entity(dict):
         key = self._must_key
         dataset = self._must_dataset
         connection = dataset.connection()
+        # NOTE: The entity is itself a dict of its properties, so pass it
+        #       directly rather than copying it; save_entity() only reads it.
         key_pb = connection.save_entity(
             dataset_id=dataset.id(),
             key_pb=key.to_protobuf(),
-            properties=dict(self))
+            properties=self)
 
         # If we are in a transaction and the current entity needs an
         # automatically assigned ID, tell the transaction where to put that.
@@ -228,13 +255,10 @@ class Entity(dict):
             #       (i.e. None, with the ID implied from the dataset.Dataset
             #       object associated with the Entity/Key), but if it was
             #       implicit before the save() we leave it as implicit.
-            path = []
-            for element in key_pb.path_element:
-                key_part = {}
-                for descriptor, value in element._fields.items():
-                    key_part[descriptor.name] = value
-                path.append(key_part)
-            self._key = key.path(path)
+            # NOTE: Imported here to avoid a circular import (helpers
+            #       depends on this module).
+            from gcloud.datastore.helpers import key_from_protobuf
+            self._key = key.path(key_from_protobuf(key_pb).path())
 
         return self
 
@@ -4,16 +4,25 @@ The non-private functions are part of the API.
 """
 __all__ = ('entity_from_protobuf', 'key_from_protobuf')
 
-import calendar
 import datetime
 
-from google.protobuf.internal.type_checkers import Int64ValueChecker
 import pytz
 
 from gcloud.datastore.entity import Entity
 from gcloud.datastore.key import Key
 
-INT_VALUE_CHECKER = Int64ValueChecker()
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+_SCALAR_VALUE_ATTRIBUTES = {
+    unicode: 'string_value',
+    bool: 'boolean_value',
+    float: 'double_value',
+    str: 'blob_value',
+}
+"""Mapping of exact scalar types onto the attribute which stores them as-is."""
 
 
 def entity_from_protobuf(pb, dataset=None):
@@ -31,9 +40,9 @@ def entity_from_protobuf(pb, dataset=None):
     key = key_from_protobuf(pb.key)
     entity = Entity.from_key(key, dataset)
 
+    get_value = _get_value_from_value_pb
     for property_pb in pb.property:
-        value = _get_value_from_property_pb(property_pb)
-        entity[property_pb.name] = value
+        entity[property_pb.name] = get_value(property_pb.value)
 
     return entity
 
@@ -108,29 +117,54 @@ def _get_protobuf_attribute_and_value(val):
     :returns: A tuple of the attribute name and proper value type.
     """
 
-    if isinstance(val, datetime.datetime):
+    # Exact scalar types need no conversion:  a type-identity lookup avoids
+    # walking the isinstance() checks in _convert_protobuf_value().
+    attr = _SCALAR_VALUE_ATTRIBUTES.get(type(val))
+    if attr is not None:
+        return attr, val
+    return _convert_protobuf_value(val)
+
+
+def _convert_protobuf_value(val):
+    """Return the protobuf attribute name and converted value for 'val'.
+
+    Unlike :func:`_get_protobuf_attribute_and_value`, this always walks
+    the ``isinstance()`` checks, so subclasses of the supported types are
+    handled as well.
+
+    :type val: `datetime.datetime`, :class:`gcloud.datastore.key.Key`,
+               bool, float, integer, string
+    :param val: The value to be scrutinized.
+
+    :returns: A tuple of the attribute name and proper value type.
+    """
+    # Check the common scalar types first.  NOTE: ``bool`` must be tested
+    # before ``int``, since it is a subclass.
+    if isinstance(val, unicode):
+        name, value = 'string', val
+    elif isinstance(val, bool):
+        name, value = 'boolean', val
+    elif isinstance(val, (int, long)):
+        if not _INT64_MIN <= val <= _INT64_MAX:
+            raise ValueError('Value out of range: %d' % val)
+        name, value = 'integer', long(val)  # Always cast to a long.
+    elif isinstance(val, float):
+        name, value = 'double', val
+    elif isinstance(val, (bytes, str)):
+        name, value = 'blob', val
+    elif isinstance(val, datetime.datetime):
         name = 'timestamp_microseconds'
         # If the datetime is naive (no timezone), consider that it was
         # intended to be UTC and replace the tzinfo to that effect.
         if not val.tzinfo:
             val = val.replace(tzinfo=pytz.utc)
-        # Regardless of what timezone is on the value, convert it to UTC.
-        val = val.astimezone(pytz.utc)
-        # Convert the datetime to a microsecond timestamp.
-        value = long(calendar.timegm(val.timetuple()) * 1e6) + val.microsecond
+        # Convert the datetime to a microsecond timestamp.  Subtracting
+        # aware datetimes accounts for any UTC offset on the value.
+        delta = val - _EPOCH
+        value = (long(delta.days * 86400 + delta.seconds) * 1000000 +
+                 delta.microseconds)
     elif isinstance(val, Key):
         name, value = 'key', val.to_protobuf()
-    elif isinstance(val, bool):
-        name, value = 'boolean', val
-    elif isinstance(val, float):
-        name, value = 'double', val
-    elif isinstance(val, (int, long)):
-        INT_VALUE_CHECKER.CheckValue(val)   # Raise an exception if invalid.
-        name, value = 'integer', long(val)  # Always cast to a long.
-    elif isinstance(val, unicode):
-        name, value = 'string', val
-    elif isinstance(val, (bytes, str)):
-        name, value = 'blob', val
     elif isinstance(val, Entity):
         name, value = 'entity', val
     elif isinstance(val, list):
@@ -141,58 +175,50 @@ def _get_protobuf_attribute_and_value(val):
     return name + '_value', value
 
 
-def _get_value_from_value_pb(value_pb):
-    """Given a protobuf for a Value, get the correct value.
-
-    The Cloud Datastore Protobuf API returns a Property Protobuf
-    which has one value set and the rest blank.
-    This function retrieves the the one value provided.
-
-    Some work is done to coerce the return value into a more useful type
-    (particularly in the case of a timestamp value, or a key value).
+def _timestamp_from_microseconds(microseconds):
+    """Convert a microsecond timestamp into an aware UTC datetime.
 
-    :type value_pb: :class:`gcloud.datastore.datastore_v1_pb2.Value`
-    :param value_pb: The Value Protobuf.
+    :type microseconds: integer
+    :param microseconds: Microseconds since the epoch.
 
-    :returns: The value provided by the Protobuf.
+    :rtype: `datetime.datetime`
+    :returns: The corresponding datetime, with ``tzinfo`` set to UTC.
     """
+    return _EPOCH + datetime.timedelta(microseconds=microseconds)
 
-    result = None
-    if value_pb.HasField('timestamp_microseconds_value'):
-        microseconds = value_pb.timestamp_microseconds_value
-        naive = (datetime.datetime.utcfromtimestamp(0) +
-                 datetime.timedelta(microseconds=microseconds))
-        result = naive.replace(tzinfo=pytz.utc)
-
-    elif value_pb.HasField('key_value'):
-        result = key_from_protobuf(value_pb.key_value)
-
-    elif value_pb.HasField('boolean_value'):
-        result = value_pb.boolean_value
-
-    elif value_pb.HasField('double_value'):
-        result = value_pb.double_value
-
-    elif value_pb.HasField('integer_value'):
-        result = value_pb.integer_value
-
-    elif value_pb.HasField('string_value'):
-        result = value_pb.string_value
-
-    elif value_pb.HasField('blob_value'):
-        result = value_pb.blob_value
 
-    elif value_pb.HasField('entity_value'):
-        result = entity_from_protobuf(value_pb.entity_value)
+def _list_from_value_pbs(value_pbs):
+    """Convert a repeated field of Value protobufs into a list of values.
 
-    elif value_pb.list_value:
-        result = [_get_value_from_value_pb(x) for x in value_pb.list_value]
+    :type value_pbs: list of :class:`gcloud.datastore.datastore_v1_pb2.Value`
+    :param value_pbs: The Value protobufs making up the list.
 
-    return result
+    :rtype: list
+    :returns: The values provided by each Protobuf.
+    """
+    return [_get_value_from_value_pb(x) for x in value_pbs]
+
+
+_VALUE_PB_CONVERTERS = {
+    'timestamp_microseconds_value': _timestamp_from_microseconds,
+    'key_value': key_from_protobuf,
+    'boolean_value': None,
+    'double_value': None,
+    'integer_value': None,
+    'string_value': None,
+    'blob_value': None,
+    'entity_value': entity_from_protobuf,
+    'list_value': _list_from_value_pbs,
+}
+"""Mapping of Value protobuf field names onto their converters.
+
+Fields mapped to ``None`` are returned as-is.  Fields missing from the
+mapping (e.g. ``meaning`` or ``indexed``) do not carry a value.
+"""
 
 
-def _get_value_from_property_pb(property_pb):
-    """Given a protobuf for a Property, get the correct value.
+def _get_value_from_value_pb(value_pb):
+    """Given a protobuf for a Value, get the correct value.
 
     The Cloud Datastore Protobuf API returns a Property Protobuf
     which has one value set and the rest blank.
@@ -201,12 +227,22 @@ def _get_value_from_property_pb(property_pb):
     Some work is done to coerce the return value into a more useful type
     (particularly in the case of a timestamp value, or a key value).
 
-    :type property_pb: :class:`gcloud.datastore.datastore_v1_pb2.Property`
-    :param property_pb: The Property Protobuf.
+    :type value_pb: :class:`gcloud.datastore.datastore_v1_pb2.Value`
+    :param value_pb: The Value Protobuf.
 
     :returns: The value provided by the Protobuf.
     """
-    return _get_value_from_value_pb(property_pb.value)
+    # ListFields() only reports fields which are set (and non-empty
+    # repeated fields), which saves probing each field with HasField().
+    for descriptor, value in value_pb.ListFields():
+        name = descriptor.name
+        if name in _VALUE_PB_CONVERTERS:
+            converter = _VALUE_PB_CONVERTERS[name]
+            if converter is None:
+                return value
+            return converter(value)
+
+    return None
 
 
 def _set_protobuf_value(value_pb, val):
@@ -1,6 +1,5 @@
 """Create / interact with gcloud datastore keys."""
 
-import copy
 from itertools import izip
 
 from gcloud.datastore import datastore_v1_pb2 as datastore_pb
@@ -12,6 +11,8 @@ class Key(object):
     .. automethod:: __init__
     """
 
+    __slots__ = ('_path', '_namespace', '_dataset_id')
+
     def __init__(self, path=None, namespace=None, dataset_id=None):
         """Constructor / initializer for a key.
 
@@ -38,17 +39,40 @@ class Key(object):
         self._namespace = namespace
         self._dataset_id = dataset_id
 
+    def __getstate__(self):
+        """Return the slot values, for pickling.
+
+        Classes defining ``__slots__`` cannot be pickled with protocols
+        0 or 1 unless they provide their own state.
+
+        :rtype: tuple
+        :returns: the key's path, namespace and dataset ID.
+        """
+        return self._path, self._namespace, self._dataset_id
+
+    def __setstate__(self, state):
+        """Restore the slot values saved by :meth:`__getstate__`.
+
+        :type state: tuple
+        :param state: the key's path, namespace and dataset ID.
+        """
+        self._path, self._namespace, self._dataset_id = state
+
     def _clone(self):
         """Duplicates the Key.
 
-        We make a shallow copy of the :class:`gcloud.datastore.dataset.Dataset`
-        because it holds a reference an authenticated connection,
-        which we don't want to lose.
+        Path elements only hold strings and integers, so copying each
+        element dict is enough to decouple the clone from ``self``;  this
+        avoids the overhead of :func:`copy.deepcopy`.
 
         :rtype: :class:`gcloud.datastore.key.Key`
         :returns: a new `Key` instance
         """
-        return copy.deepcopy(self)
+        clone = self.__class__.__new__(self.__class__)
+        clone._path = [dict(element) for element in self._path]
+        clone._namespace = self._namespace
+        clone._dataset_id = self._dataset_id
+        return clone
 
     def to_protobuf(self):
         """Return a protobuf corresponding to the key.
@@ -64,7 +88,7 @@ class Key(object):
         if self._namespace:
             key.partition_id.namespace = self._namespace
 
-        for item in self.path():
+        for item in self._path:
             element = key.path_element.add()
             if 'kind' in item:
                 element.kind = item['kind']
@@ -167,7 +191,7 @@ class Key(object):
             clone = self._clone()
             clone._path[-1]['kind'] = kind
             return clone
-        elif self.path():
+        elif self._path:
             return self._path[-1]['kind']
 
     def id(self, id_to_set=None):
@@ -184,7 +208,7 @@ class Key(object):
             clone = self._clone()
             clone._path[-1]['id'] = id_to_set
             return clone
-        elif self.path():
+        elif self._path:
             return self._path[-1].get('id')
 
     def name(self, name=None):
@@ -201,7 +225,7 @@ class Key(object):
             clone = self._clone()
             clone._path[-1]['name'] = name
             return clone
-        elif self.path():
+        elif self._path:
             return self._path[-1].get('name')
 
     def id_or_name(self):
@@ -223,7 +247,7 @@ class Key(object):
         """
         if len(self._path) <= 1:
             return None
-        return self.path(self.path()[:-1])
+        return self.path(self._path[:-1])
 
     def __repr__(self):
-        return '<Key%s>' % self.path()
+        return '<Key%s>' % self._path
@@ -328,13 +328,14 @@ class Query(object):
         :returns: The list of entities matching this query's criteria.
         """
         clone = self
+        dataset = self.dataset()
 
         if limit:
             clone = self.limit(limit)
 
-        query_results = self.dataset().connection().run_query(
+        query_results = dataset.connection().run_query(
             query_pb=clone.to_protobuf(),
-            dataset_id=self.dataset().id(),
+            dataset_id=dataset.id(),
             namespace=self._namespace,
             )
         # NOTE: `query_results` contains two extra values that we don't use,
@@ -347,7 +348,8 @@ class Query(object):
         entity_pbs, end_cursor = query_results[:2]
 
         self._cursor = end_cursor
-        return [helpers.entity_from_protobuf(entity, dataset=self.dataset())
+        entity_from_protobuf = helpers.entity_from_protobuf
+        return [entity_from_protobuf(entity, dataset=dataset)
                 for entity in entity_pbs]
 
     def cursor(self):
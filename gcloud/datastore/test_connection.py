@@ -737,6 +737,28 @@ class TestConnection(unittest2.TestCase):
         mutation = conn.mutation()
         self.assertEqual(len(mutation.upsert), 1)
 
+    def test_save_entity_w_transaction_w_multiple_properties(self):
+        from gcloud.datastore.connection import datastore_pb
+        from gcloud.datastore.key import Key
+
+        mutation = datastore_pb.Mutation()
+
+        class Xact(object):
+            def mutation(self):
+                return mutation
+        DATASET_ID = 'DATASET'
+        key_pb = Key(path=[{'kind': 'Kind', 'id': 1234}]).to_protobuf()
+        conn = self._makeOne()
+        conn.transaction(Xact())
+        result = conn.save_entity(DATASET_ID, key_pb,
+                                  {'foo': u'Foo', 'bar': 42})
+        self.assertEqual(result, True)
+        upsert, = list(mutation.upsert)
+        props = dict((prop.name, prop.value) for prop in upsert.property)
+        self.assertEqual(sorted(props), ['bar', 'foo'])
+        self.assertEqual(props['foo'].string_value, u'Foo')
+        self.assertEqual(props['bar'].integer_value, 42)
+
     def test_save_entity_w_transaction_nested_entity(self):
         from gcloud.datastore.connection import datastore_pb
         from gcloud.datastore.entity import Entity
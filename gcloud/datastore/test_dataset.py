@@ -84,6 +84,48 @@ class TestDataset(unittest2.TestCase):
         self.assertEqual(list(result), ['foo'])
         self.assertEqual(result['foo'], 'Foo')
 
+    def test_get_entities_w_duplicate_keys(self):
+        from gcloud.datastore.key import Key
+        DATASET_ID = 'DATASET'
+        connection = _Connection()
+        dataset = self._makeOne(DATASET_ID, connection)
+        key1 = Key(path=[{'kind': 'Kind', 'id': 1234}])
+        key2 = Key(path=[{'kind': 'Kind', 'id': 2345}])
+        key3 = Key(path=[{'kind': 'Kind', 'id': 1234}])
+        key4 = Key(path=[{'kind': 'Kind', 'id': 1234}], namespace='')
+        key5 = Key(path=[{'kind': 'Kind', 'id': 1234}], namespace='OTHER')
+        keys = [key1, key2, key3, key4, key5]
+        self.assertEqual(dataset.get_entities(keys), [])
+        key_pbs = connection._called_with['key_pbs']
+        self.assertEqual(key_pbs, [key1.to_protobuf(), key2.to_protobuf(),
+                                   key5.to_protobuf()])
+
+    def test_get_entities_hit_w_duplicate_keys(self):
+        from gcloud.datastore.connection import datastore_pb
+        from gcloud.datastore.key import Key
+        DATASET_ID = 'DATASET'
+        KIND = 'Kind'
+        ID = 1234
+        PATH = [{'kind': KIND, 'id': ID}]
+        entity_pb = datastore_pb.Entity()
+        entity_pb.key.partition_id.dataset_id = DATASET_ID
+        path_element = entity_pb.key.path_element.add()
+        path_element.kind = KIND
+        path_element.id = ID
+        prop = entity_pb.property.add()
+        prop.name = 'foo'
+        prop.value.string_value = 'Foo'
+        connection = _Connection(entity_pb)
+        dataset = self._makeOne(DATASET_ID, connection)
+        missing = Key(path=[{'kind': KIND, 'id': 2345}])
+        keys = [Key(path=PATH), missing, Key(path=PATH)]
+        first, second = dataset.get_entities(keys)
+        self.assertEqual(len(connection._called_with['key_pbs']), 2)
+        self.assertFalse(first is second)
+        for result in (first, second):
+            self.assertEqual(result.key().path(), PATH)
+            self.assertEqual(result['foo'], 'Foo')
+
     def test_get_entity_miss(self):
         from gcloud.datastore.key import Key
         DATASET_ID = 'DATASET'
@@ -35,6 +35,17 @@ class TestEntity(unittest2.TestCase):
         entity = self._makeOne(dataset, _KIND)
         self.assertTrue(entity.dataset() is dataset)
 
+    def test_pickle_roundtrip(self):
+        import pickle
+        entity = self._makeOne()
+        entity['foo'] = u'Foo'
+        for protocol in (0, pickle.HIGHEST_PROTOCOL):
+            restored = pickle.loads(pickle.dumps(entity, protocol))
+            self.assertTrue(isinstance(restored, self._getTargetClass()))
+            self.assertEqual(dict(restored), {'foo': u'Foo'})
+            self.assertEqual(restored.dataset().id(), _DATASET_ID)
+            self.assertEqual(restored.key().path(), [{'kind': _KIND}])
+
     def test_key_getter(self):
         from gcloud.datastore.key import Key
 
@@ -43,6 +54,7 @@ class TestEntity(unittest2.TestCase):
         self.assertIsInstance(key, Key)
         self.assertEqual(key._dataset_id, None)
         self.assertEqual(key.kind(), _KIND)
+        self.assertEqual(key.path(), [{'kind': _KIND}])
 
     def test_key_setter(self):
         entity = self._makeOne()
@@ -184,6 +196,23 @@ class TestEntity(unittest2.TestCase):
                          (_DATASET_ID, 'KEY', {'foo': 'Foo'}))
         self.assertEqual(key._path, [{'kind': _KIND, 'id': _ID}])
 
+    def test_save_w_returned_key_w_parent(self):
+        from gcloud.datastore import datastore_v1_pb2 as datastore_pb
+        key_pb = datastore_pb.Key()
+        key_pb.partition_id.dataset_id = _DATASET_ID
+        key_pb.path_element.add(kind='PARENT', name='NAME')
+        key_pb.path_element.add(kind=_KIND, id=_ID)
+        connection = _Connection()
+        connection._save_result = key_pb
+        dataset = _Dataset(connection)
+        key = _Key()
+        entity = self._makeOne(dataset)
+        entity.key(key)
+        entity['foo'] = 'Foo'
+        self.assertTrue(entity.save() is entity)
+        self.assertEqual(key._path, [{'kind': 'PARENT', 'name': 'NAME'},
+                                     {'kind': _KIND, 'id': _ID}])
+
     def test_delete_no_key(self):
         from gcloud.datastore.entity import NoKey
 
@@ -148,6 +148,20 @@ class Test__get_protobuf_attribute_and_value(unittest2.TestCase):
         self.assertEqual(value / 1000000, calendar.timegm(utc.timetuple()))
         self.assertEqual(value % 1000000, 4375)
 
+    def test_datetime_w_other_zone(self):
+        import calendar
+        import datetime
+        import pytz
+
+        utc = datetime.datetime(2014, 9, 16, 10, 19, 32, 4375, pytz.utc)
+        zone = pytz.timezone('US/Pacific')
+        local = utc.astimezone(zone)
+        name, value = self._callFUT(local)
+        self.assertEqual(name, 'timestamp_microseconds_value')
+        self.assertTrue(isinstance(value, long))
+        self.assertEqual(value / 1000000, calendar.timegm(utc.timetuple()))
+        self.assertEqual(value % 1000000, 4375)
+
     def test_key(self):
         from gcloud.datastore.key import Key
 
@@ -204,6 +218,42 @@ class Test__get_protobuf_attribute_and_value(unittest2.TestCase):
         self.assertEqual(name, 'string_value')
         self.assertEqual(value, u'str')
 
+    def test_unicode_subclass(self):
+        class _Text(unicode):
+            pass
+
+        text = _Text(u'str')
+        name, value = self._callFUT(text)
+        self.assertEqual(name, 'string_value')
+        self.assertTrue(value is text)
+
+    def test_int_subclass(self):
+        class _Int(int):
+            pass
+
+        name, value = self._callFUT(_Int(42))
+        self.assertEqual(name, 'integer_value')
+        self.assertEqual(value, 42)
+        self.assertTrue(type(value) is long)
+
+    def test_float_subclass(self):
+        class _Float(float):
+            pass
+
+        flt = _Float(3.1415926)
+        name, value = self._callFUT(flt)
+        self.assertEqual(name, 'double_value')
+        self.assertTrue(value is flt)
+
+    def test_str_subclass(self):
+        class _Bytes(str):
+            pass
+
+        blob = _Bytes('bytes')
+        name, value = self._callFUT(blob)
+        self.assertEqual(name, 'blob_value')
+        self.assertTrue(value is blob)
+
     def test_entity(self):
         from gcloud.datastore.entity import Entity
         entity = Entity()
@@ -221,6 +271,31 @@ class Test__get_protobuf_attribute_and_value(unittest2.TestCase):
         self.assertRaises(ValueError, self._callFUT, object())
 
 
+class Test__convert_protobuf_value(unittest2.TestCase):
+
+    def _callFUT(self, val):
+        from gcloud.datastore.helpers import _convert_protobuf_value
+
+        return _convert_protobuf_value(val)
+
+    def test_bool(self):
+        name, value = self._callFUT(True)
+        self.assertEqual(name, 'boolean_value')
+        self.assertEqual(value, True)
+        self.assertTrue(type(value) is bool)
+
+    def test_unicode(self):
+        name, value = self._callFUT(u'str')
+        self.assertEqual(name, 'string_value')
+        self.assertEqual(value, u'str')
+
+    def test_int(self):
+        name, value = self._callFUT(42)
+        self.assertEqual(name, 'integer_value')
+        self.assertEqual(value, 42)
+        self.assertTrue(type(value) is long)
+
+
 class Test__get_value_from_value_pb(unittest2.TestCase):
 
     def _callFUT(self, pb):
@@ -245,6 +320,16 @@ class Test__get_value_from_value_pb(unittest2.TestCase):
         pb = self._makePB('timestamp_microseconds_value', micros)
         self.assertEqual(self._callFUT(pb), utc)
 
+    def test_datetime_before_epoch(self):
+        import datetime
+        import pytz
+
+        pb = self._makePB('timestamp_microseconds_value', -1)
+        found = self._callFUT(pb)
+        self.assertEqual(found, datetime.datetime(1969, 12, 31, 23, 59, 59,
+                                                  999999, pytz.utc))
+        self.assertTrue(found.tzinfo is pytz.utc)
+
     def test_key(self):
         from gcloud.datastore.datastore_v1_pb2 import Value
         from gcloud.datastore.key import Key
@@ -310,20 +395,15 @@ class Test__get_value_from_value_pb(unittest2.TestCase):
         pb = Value()
         self.assertEqual(self._callFUT(pb), None)
 
+    def test_w_meaning_and_indexed(self):
+        pb = self._makePB('integer_value', 42)
+        pb.meaning = 7
+        pb.indexed = False
+        self.assertEqual(self._callFUT(pb), 42)
 
-class Test__get_value_from_property_pb(unittest2.TestCase):
-
-    def _callFUT(self, pb):
-        from gcloud.datastore.helpers import _get_value_from_property_pb
-
-        return _get_value_from_property_pb(pb)
-
-    def test_it(self):
-        from gcloud.datastore.datastore_v1_pb2 import Property
-
-        pb = Property()
-        pb.value.string_value = 'value'
-        self.assertEqual(self._callFUT(pb), 'value')
+    def test_w_only_indexed(self):
+        pb = self._makePB('indexed', False)
+        self.assertEqual(self._callFUT(pb), None)
 
 
 class Test_set_protobuf_value(unittest2.TestCase):
@@ -338,6 +418,22 @@ class Test_set_protobuf_value(unittest2.TestCase):
 
         return Value()
 
+    def test_exact_scalars_skip_conversion(self):
+        from gcloud._testing import _Monkey
+        from gcloud.datastore import helpers
+
+        def _convert(val):
+            raise AssertionError('converted %r' % (val,))
+
+        with _Monkey(helpers, _convert_protobuf_value=_convert):
+            for val, attr in ((u'str', 'string_value'),
+                              (True, 'boolean_value'),
+                              (3.1415926, 'double_value'),
+                              ('bytes', 'blob_value')):
+                pb = self._makePB()
+                self._callFUT(pb, val)
+                self.assertEqual(getattr(pb, attr), val)
+
     def test_datetime(self):
         import calendar
         import datetime
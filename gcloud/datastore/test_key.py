@@ -29,6 +29,24 @@ class TestKey(unittest2.TestCase):
         self.assertEqual(key.kind(), _KIND)
         self.assertEqual(key.path(), _PATH)
 
+    def test_ctor_uses_slots(self):
+        key = self._makeOne()
+        self.assertFalse(hasattr(key, '__dict__'))
+        self.assertRaises(AttributeError, setattr, key, 'foo', 'bar')
+
+    def test_pickle_roundtrip(self):
+        import pickle
+        _DATASET = 'DATASET'
+        _NAMESPACE = 'NAMESPACE'
+        _PATH = [{'kind': 'KIND', 'id': 1234}]
+        key = self._makeOne(_PATH, _NAMESPACE, _DATASET)
+        for protocol in (0, pickle.HIGHEST_PROTOCOL):
+            restored = pickle.loads(pickle.dumps(key, protocol))
+            self.assertTrue(isinstance(restored, self._getTargetClass()))
+            self.assertEqual(restored._dataset_id, _DATASET)
+            self.assertEqual(restored.namespace(), _NAMESPACE)
+            self.assertEqual(restored.path(), _PATH)
+
     def test__clone(self):
         _DATASET = 'DATASET'
         _NAMESPACE = 'NAMESPACE'
@@ -41,6 +59,8 @@ class TestKey(unittest2.TestCase):
         self.assertEqual(clone.namespace(), _NAMESPACE)
         self.assertEqual(clone.kind(), _KIND)
         self.assertEqual(clone.path(), _PATH)
+        self.assertFalse(clone.path() is key.path())
+        self.assertFalse(clone.path()[0] is key.path()[0])
 
     def test_to_protobuf_defaults(self):
         from gcloud.datastore.datastore_v1_pb2 import Key as KeyPB
@@ -84,6 +84,16 @@ class TestTransaction(unittest2.TestCase):
         self.assertEqual(xact.id(), None)
         self.assertEqual(entity._key._path, [{'kind': _KIND, 'id': _ID}])
 
+    def test_commit_w_missing_auto_id_key(self):
+        _DATASET = 'DATASET'
+        connection = _Connection(234)
+        dataset = _Dataset(_DATASET, connection)
+        xact = self._makeOne(dataset)
+        xact.add_auto_id_entity(_Entity())
+        xact._mutation = object()
+        xact.begin()
+        self.assertRaises(IndexError, xact.commit)
+
     def test_commit_w_already(self):
         _DATASET = 'DATASET'
         connection = _Connection(234)
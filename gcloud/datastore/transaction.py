@@ -229,18 +229,18 @@ class Transaction(object):
         """
         # It's possible that they called commit() already, in which case
         # we shouldn't do any committing of our own.
-        if self.connection().transaction():
-            result = self.connection().commit(self.dataset().id(),
-                                              self.mutation())
+        connection = self.connection()
+        if connection.transaction():
+            result = connection.commit(self.dataset().id(), self.mutation())
 
             # For any of the auto-id entities, make sure we update their keys.
+            key_from_protobuf = helpers.key_from_protobuf
             for i, entity in enumerate(self._auto_id_entities):
-                key_pb = result.insert_auto_id_key[i]
-                key = helpers.key_from_protobuf(key_pb)
+                key = key_from_protobuf(result.insert_auto_id_key[i])
                 entity.key(entity.key().path(key.path()))
 
         # Tell the connection that the transaction is over.
-        self.connection().transaction(None)
+        connection.transaction(None)
 
         # Clear our own ID in case this gets accidentally reused.
         self._id = None
@@ -291,15 +291,19 @@ class Key(object):
         """Upload contents of this key from the provided string.
 
         :type data: string
-        :param data: The data to store in this key.
+        :param data: The data to store in this key.  Text ('unicode') is
+                     encoded as UTF-8 before being uploaded.
 
         :rtype: :class:`Key`
         :returns: The updated Key object.
         """
-        string_buffer = StringIO()
-        string_buffer.write(data)
-        self.set_contents_from_file(file_obj=string_buffer, rewind=True,
-                                    size=string_buffer.len,
+        # Encode text exactly once, so that the chunk sizes (and therefore
+        # the Content-Range headers) are measured in bytes.
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        # Wrap the string directly rather than copying it into a buffer.
+        string_buffer = StringIO(data)
+        self.set_contents_from_file(file_obj=string_buffer, size=len(data),
                                     content_type=content_type)
         return self
 
@@ -495,6 +499,7 @@ class _KeyDataIterator(object):
         # NOTE: These variables will be initialized by reset().
         self._bytes_written = None
         self._total_bytes = None
+        self._url = None
         self.reset()
 
     def __iter__(self):
@@ -505,6 +510,7 @@ class _KeyDataIterator(object):
         """Resets the iterator to the beginning."""
         self._bytes_written = 0
         self._total_bytes = None
+        self._url = None
 
     def has_more_data(self):
         """Determines whether or not this iterator has more data to read.
@@ -538,11 +544,16 @@ class _KeyDataIterator(object):
     def get_url(self):
         """Gets URL to read next chunk of data.
 
+        The URL is the same for every chunk, so it is built on first use
+        and reused until the iterator is reset.
+
         :rtype: string
         :returns: A URL.
         """
-        return self.key.connection.build_api_url(
-            path=self.key.path, query_params={'alt': 'media'})
+        if self._url is None:
+            self._url = self.key.connection.build_api_url(
+                path=self.key.path, query_params={'alt': 'media'})
+        return self._url
 
     def get_next_chunk(self):
         """Gets the next chunk of data.
@@ -326,6 +326,33 @@ class Test_Key(unittest2.TestCase):
         self.assertEqual(rq[2]['data'], DATA[5:])
         self.assertEqual(rq[2]['headers'], {'Content-Range': 'bytes 5-5/6'})
 
+    def test_upload_from_string_w_unicode(self):
+        KEY = 'key'
+        UPLOAD_URL = 'http://example.com/upload/name/key'
+        DATA = u'\u00e9t\u00e9'
+        ENCODED = DATA.encode('utf-8')
+        loc_response = {'location': UPLOAD_URL}
+        chunk1_response = {}
+        chunk2_response = {}
+        connection = _Connection(
+            (loc_response, ''),
+            (chunk1_response, ''),
+            (chunk2_response, ''),
+        )
+        bucket = _Bucket(connection)
+        key = self._makeOne(bucket, KEY)
+        key.CHUNK_SIZE = 3
+        key.upload_from_string(DATA)
+        rq = connection._requested
+        self.assertEqual(len(rq), 3)
+        self.assertEqual(rq[0]['headers'],
+                         {'X-Upload-Content-Length': 5,
+                          'X-Upload-Content-Type': 'text/plain'})
+        self.assertEqual(rq[1]['data'], ENCODED[:3])
+        self.assertEqual(rq[1]['headers'], {'Content-Range': 'bytes 0-2/5'})
+        self.assertEqual(rq[2]['data'], ENCODED[3:])
+        self.assertEqual(rq[2]['headers'], {'Content-Range': 'bytes 3-4/5'})
+
     def test_has_metdata_none_set(self):
         NONESUCH = 'nonesuch'
         key = self._makeOne()
@@ -669,9 +696,11 @@ class Test__KeyDataIterator(unittest2.TestCase):
         iterator = self._makeOne(key)
         iterator._bytes_written = 10
         iterator._total_bytes = 1000
+        iterator._url = 'http://example.com/other'
         iterator.reset()
         self.assertEqual(iterator._bytes_written, 0)
         self.assertEqual(iterator._total_bytes, None)
+        self.assertEqual(iterator._url, None)
 
     def test_has_more_data_new(self):
         connection = _Connection()
@@ -737,6 +766,13 @@ class Test__KeyDataIterator(unittest2.TestCase):
         self.assertEqual(iterator.get_url(),
                          'http://example.com/b/name/o/key?alt=media')
 
+    def test_get_url_cached(self):
+        connection = _Connection()
+        key = _Key(connection)
+        iterator = self._makeOne(key)
+        url = iterator.get_url()
+        self.assertTrue(iterator.get_url() is url)
+
     def test_get_next_chunk_underflow(self):
         connection = _Connection()
         key = _Key(connection)